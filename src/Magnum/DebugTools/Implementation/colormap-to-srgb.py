@@ -29,36 +29,40 @@
 # https://raw.githubusercontent.com/BIDS/colormap/master/colormaps.py
 from colormaps import _magma_data, _plasma_data, _inferno_data, _viridis_data
 
+import sys
 from typing import List, Tuple
 
+import numpy as np
+
 def colors(data: List[Tuple[float, float, float]]):
-    for i, color in enumerate(data):
-        if i and i % 4 == 0: print(",\n    ", end='')
-        elif i: print(", ", end='')
+    # Seems like the values are already in sRGB -- applying the sRGB curve
+    # on those with Color3(color).to_srgb_int() washes them out compared to
+    # the 'official' rendering
+    srgb = (np.asarray(data)*255).astype(np.uint8)
+    chunks = ['{{{:>3}, {:>3}, {:>3}}}'.format(*row) for row in srgb]
+    return ',\n'.join('    ' + ', '.join(chunks[i:i + 4])
+                      for i in range(0, len(chunks), 4))
+
+out = []
 
-        # Seems like the values are already in sRGB -- applying the sRGB curve
-        # on those with Color3(color).to_srgb_int() washes them out compared to
-        # the 'official' rendering
-        srgb = [int(c*255) for c in color]
-        print('{{{:>3}, {:>3}, {:>3}}}'.format(srgb[0], srgb[1], srgb[2]), end='')
-    print('')
+out += ["/* Generated with Implementation/colormap-to-srgb.py */\n",
+        "constexpr UnsignedByte Magma[][3] = {\n",
+        colors(_magma_data),
+        "\n};\n\n"]
 
-print("/* Generated with Implementation/colormap-to-srgb.py */")
-print("constexpr UnsignedByte Magma[][3] = {\n    ", end='')
-colors(_magma_data)
-print("};\n")
+out += ["/* Generated with Implementation/colormap-to-srgb.py */\n",
+        "constexpr UnsignedByte Plasma[][3] = {\n",
+        colors(_plasma_data),
+        "\n};\n\n"]
 
-print("/* Generated with Implementation/colormap-to-srgb.py */")
-print("constexpr UnsignedByte Plasma[][3] = {\n    ", end='')
-colors(_plasma_data)
-print("};\n")
+out += ["/* Generated with Implementation/colormap-to-srgb.py */\n",
+        "constexpr UnsignedByte Inferno[][3] = {\n",
+        colors(_inferno_data),
+        "\n};\n\n"]
 
-print("/* Generated with Implementation/colormap-to-srgb.py */")
-print("constexpr UnsignedByte Inferno[][3] = {\n    ", end='')
-colors(_inferno_data)
-print("};\n")
+out += ["/* Generated with Implementation/colormap-to-srgb.py */\n",
+        "constexpr UnsignedByte Viridis[][3] = {\n",
+        colors(_viridis_data),
+        "\n};\n\n"]
 
-print("/* Generated with Implementation/colormap-to-srgb.py */")
-print("constexpr UnsignedByte Viridis[][3] = {\n    ", end='')
-colors(_viridis_data)
-print("};\n")
+sys.stdout.write(''.join(out))
@@ -26,32 +26,30 @@
 #   DEALINGS IN THE SOFTWARE.
 #
 
-from numpy import genfromtxt
+import sys
+
+from numpy import loadtxt
 
 def format(filename):
-    data = genfromtxt(filename, delimiter=',')
-    formatted = ''
-    data = data[1:,1:].astype(int)
-    formatted = ''
+    # Skip the header and the scalar column, parse just the RGB bytes
+    data = loadtxt(filename, delimiter=',', skiprows=1, usecols=(1, 2, 3),
+                   dtype=int)
+    chunks = ['{{{:>3}, {:>3}, {:>3}}}'.format(*row) for row in data]
+    return ',\n'.join('    ' + ', '.join(chunks[i:i + 4])
+                      for i in range(0, len(chunks), 4))
 
-    for i in range(256//4):
-        line = '    '
-        for j in range(4):
-            row = data[4*i+j]
-            line += '{{{:>3}, {:>3}, {:>3}}}, '.format(row[0], row[1], row[2])
-        formatted = formatted + line + '\n'
+# The two CSV files taken from https://www.kennethmoreland.com/color-advice/
 
-    # Strip trailing comma and newline
-    return formatted[:-3]
+out = []
 
-# The two CSV files taken from https://www.kennethmoreland.com/color-advice/
+out += ["/* Generated with Implementation/cool-warm.py */\n",
+        "constexpr UnsignedByte CoolWarmSmooth[][3] = {\n",
+        format('smooth-cool-warm-table-byte-0256.csv'),
+        "\n};\n\n"]
 
-print("/* Generated with Implementation/cool-warm.py */")
-print("constexpr UnsignedByte CoolWarmSmooth[][3] = {\n", end='')
-print(format('smooth-cool-warm-table-byte-0256.csv'))
-print("};\n")
+out += ["/* Generated with Implementation/cool-warm.py */\n",
+        "constexpr UnsignedByte CoolWarmBent[][3] = {\n",
+        format('bent-cool-warm-table-byte-0256.csv'),
+        "\n};\n\n"]
 
-print("/* Generated with Implementation/cool-warm.py */")
-print("constexpr UnsignedByte CoolWarmBent[][3] = {\n", end='')
-print(format('bent-cool-warm-table-byte-0256.csv'))
-print("};\n")
+sys.stdout.write(''.join(out))